@@ -1,7 +1,7 @@
 """Green agent for code agent benchmark evaluation."""
 
 import logging
-from typing import List
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 
 
@@ -25,18 +25,25 @@ class Agent:
 
     required_roles: List[str] = ["code_agent"]
 
-    def __init__(self, model: str = None):
+    def __init__(
+        self,
+        model: str = None,
+        debug: bool = False,
+        bigcodebench_loader: Optional[BigCodeBenchLoader] = None,
+        bigcodebench_tasks: Optional[List[Dict[str, Any]]] = None,
+    ):
         self.model = model
+        self._required_roles = frozenset(self.required_roles)
         self.messenger = Messenger()
 
         # Loaders
         script_dir = Path(__file__).parent
         tasks_dir = script_dir.parent / "tasks"
         self.task_loader = TaskLoader(str(tasks_dir))
-        self.bigcodebench_loader = BigCodeBenchLoader()
+        self.bigcodebench_loader = bigcodebench_loader or BigCodeBenchLoader()
 
         # Evaluators
-        self.evaluators = {"code_generation": CodeGenerationEvaluator()}
+        self.evaluators = {"code_generation": CodeGenerationEvaluator(debug=debug)}
 
         # Orchestrator
         self.orchestrator = BenchmarkOrchestrator(
@@ -44,6 +51,8 @@ class Agent:
             messenger=self.messenger,
             task_loader=self.task_loader,
             bigcodebench_loader=self.bigcodebench_loader,
+            # Formatted once by the executor; loaded on first use if absent
+            bigcodebench_tasks=bigcodebench_tasks,
         )
 
         if self.model:
@@ -51,7 +60,8 @@ class Agent:
 
     def validate_request(self, request: EvalRequest) -> tuple[bool, str]:
         """Validate the evaluation request."""
-        missing_roles = set(self.required_roles) - set(request.participants.keys())
+        # Dict key views support set operations directly, no copies needed
+        missing_roles = self._required_roles - request.participants.keys()
         if missing_roles:
             return False, f"Missing roles: {missing_roles}"
 
@@ -1,7 +1,11 @@
 """Core orchestration logic for the Code Agent Benchmark."""
 
+import asyncio
+import contextlib
 import logging
-from typing import Dict, Any
+import re
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from a2a.server.tasks import TaskUpdater
 from a2a.types import TaskState
 from a2a.utils import new_agent_text_message
@@ -11,6 +15,33 @@ from models import TaskResult, BenchmarkResult
 
 logger = logging.getLogger("benchmark_orchestrator")
 
+# First line that marks the start of actual code in an unfenced response
+_CODE_START_RE = re.compile(r"^[^\S\n]*(?:import|from|def) .*\S", re.MULTILINE)
+
+
+def _iter_code_fences(text: str) -> Iterator[str]:
+    """Yield the contents of triple-backtick blocks in order.
+
+    Supports ```python code ``` or just ``` code ```. Uses plain str.find
+    scanning, so it runs in linear time even on inputs with many stray
+    backticks.
+    """
+    pos = 0
+    while True:
+        start = text.find("```", pos)
+        if start < 0:
+            return
+        body = start + 3
+        if text.startswith("python", body):
+            body += 6
+        if text.startswith("\n", body):
+            body += 1
+        end = text.find("```", body)
+        if end < 0:
+            return
+        yield text[body:end]
+        pos = end + 3
+
 
 class BenchmarkOrchestrator:
     """Orchestrates the benchmark execution loop."""
@@ -21,54 +52,108 @@ class BenchmarkOrchestrator:
         messenger: Any,
         task_loader: Any,
         bigcodebench_loader: Any,
+        bigcodebench_tasks: Optional[List[Dict[str, Any]]] = None,
     ):
         self.evaluators = evaluator_map
         self.messenger = messenger
         self.task_loader = task_loader
         self.bigcodebench_loader = bigcodebench_loader
+        # Preloaded full split; loaded lazily from bigcodebench_loader if absent
+        self.bigcodebench_tasks = bigcodebench_tasks
         self.reporter = BenchmarkReporter()
 
+        # Filtered BigCodeBench task lists keyed by (source, stdlib_only, difficulty)
+        self._task_cache: Dict[Tuple, List[Dict[str, Any]]] = {}
+        self._task_cache_lock = asyncio.Lock()
+
+    def reset_task_cache(self):
+        """Drop cached task lists so the next run reloads them."""
+        self._task_cache.clear()
+
+    def _load_bigcodebench_tasks(
+        self, stdlib_only: bool, difficulty: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Load and filter the full BigCodeBench split."""
+        if stdlib_only:
+            # Filtered on the libs column alone and cached by the loader
+            tasks = self.bigcodebench_loader.load_stdlib_tasks()
+        else:
+            tasks = self.bigcodebench_tasks
+            if tasks is None:
+                tasks = self.bigcodebench_loader.load_tasks(limit=None)
+        if difficulty:
+            tasks = [t for t in tasks if t["difficulty"] == difficulty]
+        return tasks
+
+    async def _get_bigcodebench_tasks(
+        self, stdlib_only: bool, difficulty: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Return filtered BigCodeBench tasks, building them once per filter."""
+        key = ("bigcodebench", stdlib_only, difficulty)
+        # The lock keeps concurrent runs from building the same list twice
+        async with self._task_cache_lock:
+            tasks = self._task_cache.get(key)
+            if tasks is None:
+                tasks = await asyncio.to_thread(
+                    self._load_bigcodebench_tasks, stdlib_only, difficulty
+                )
+                self._task_cache[key] = tasks
+        return tasks
+
     def _clean_code_submission(self, submission: str) -> str:
         """Robustly extract Python code from model response."""
-        import re
-
         # Trim whitespace
         submission = submission.strip()
 
-        # Try to find content inside triple backticks
-        # Supports ```python code ``` or just ``` code ```
-        code_blocks = re.findall(r"```(?:python)?\n?(.*?)```", submission, re.DOTALL)
-
-        if code_blocks:
-            # If multiple blocks, pick the one that looks most like code (has def/import)
-            # or just the first one if unsure
-            for block in code_blocks:
-                if "def " in block or "import " in block:
-                    return block.strip()
-            return code_blocks[0].strip()
+        # Try to find content inside triple backticks.
+        # If multiple blocks, pick the one that looks most like code (has def/import)
+        # or just the first one if unsure. Blocks are found lazily so the scan
+        # stops at the first code-like block instead of covering the whole
+        # response.
+        first_block = None
+        for block in _iter_code_fences(submission):
+            if "def " in block or "import " in block:
+                return block.strip()
+            if first_block is None:
+                first_block = block
+        if first_block is not None:
+            return first_block.strip()
 
         # If no backticks, try to remove common conversational headers/footers
         # (Though refined prompts should minimize this)
-        lines = submission.split("\n")
-        cleaned_lines = []
-        in_code = False
-
-        # Heuristic: start keeping lines from first import or def
-        for line in lines:
-            if not in_code and (
-                line.strip().startswith("import ")
-                or line.strip().startswith("from ")
-                or line.strip().startswith("def ")
-            ):
-                in_code = True
-
-            if in_code:
-                cleaned_lines.append(line)
-
-        if cleaned_lines:
-            return "\n".join(cleaned_lines).strip()
+        # Heuristic: keep everything from the first import or def line onwards
+        match = _CODE_START_RE.search(submission)
+        if match:
+            return submission[match.start():].strip()
+
+        return submission
+
+    @staticmethod
+    async def _emit_progress(updater: TaskUpdater, state: Dict[str, Any]) -> None:
+        """Send the current progress if it changed since the last update."""
+        done = state["done"]
+        if done == state["reported"]:
+            return
+        # The first update also announces the task count, saving a separate
+        # "Loaded N tasks" status message
+        prefix = "" if state["reported"] else f"Loaded {state['total']} tasks. "
+        await updater.update_status(
+            TaskState.working,
+            new_agent_text_message(
+                f"{prefix}[{done}/{state['total']}] Tasks evaluated. "
+                f"Last finished: {state['last_title']}"
+            ),
+        )
+        state["reported"] = done
 
-        return submission.strip()
+    @classmethod
+    async def _progress_pump(
+        cls, updater: TaskUpdater, state: Dict[str, Any], interval: float = 0.5
+    ):
+        """Emit one coalesced progress update per interval while tasks run."""
+        while True:
+            await asyncio.sleep(interval)
+            await cls._emit_progress(updater, state)
 
     async def run_benchmark(
         self,
@@ -82,16 +167,16 @@ class BenchmarkOrchestrator:
         num_tasks = request_config.get("num_tasks", 5)
         difficulty = request_config.get("difficulty")
         stdlib_only = request_config.get("stdlib_only", True)
+        concurrency = request_config.get("concurrency", 8)
         agent_url = participants["code_agent"]
 
+        # A semaphore of 0 would block every task forever, so reject it up front
+        if isinstance(concurrency, bool) or not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError(f"concurrency must be an integer >= 1, got {concurrency!r}")
+
         # Load tasks
         if source == "bigcodebench":
-            from utils.stdlib_filter import filter_stdlib_tasks
-
-            all_tasks = self.bigcodebench_loader.load_tasks(limit=None)
-            tasks = filter_stdlib_tasks(all_tasks) if stdlib_only else all_tasks
-            if difficulty:
-                tasks = [t for t in tasks if t["difficulty"] == difficulty]
+            tasks = await self._get_bigcodebench_tasks(stdlib_only, difficulty)
             tasks = tasks[:num_tasks]
         else:
             tasks = self.task_loader.load_tasks_by_category(
@@ -101,24 +186,18 @@ class BenchmarkOrchestrator:
         if not tasks:
             raise ValueError(f"No tasks found for source {source}")
 
-        await updater.update_status(
-            TaskState.working,
-            new_agent_text_message(f"Loaded {len(tasks)} tasks. Starting evaluation."),
-        )
-
-        task_results = []
         evaluator = self.evaluators[category]
+        total = len(tasks)
+        sem = asyncio.Semaphore(concurrency)
 
-        for idx, task in enumerate(tasks, 1):
-            await updater.update_status(
-                TaskState.working,
-                new_agent_text_message(
-                    f"[{idx}/{len(tasks)}] Running task: {task['title']}"
-                ),
-            )
+        # Workers only update this shared state; _progress_pump turns it into
+        # at most one status message per interval
+        progress = {"done": 0, "reported": 0, "total": total, "last_title": None}
 
-            prompt = task["prompt"]
-            task_description = f"""You are solving a coding task. Please provide ONLY the Python code for the function requested.
+        async def _run_one(task: Dict[str, Any]) -> TaskResult:
+            async with sem:
+                prompt = task["prompt"]
+                task_description = f"""You are solving a coding task. Please provide ONLY the Python code for the function requested.
 
 Task: {task["title"]}
 Description: {task["description"]}
@@ -130,75 +209,90 @@ Important:
 2. Do not include explanations or markdown formatting.
 3. Your main function MUST be named '{task['entry_point']}' or 'task_func'."""
 
-            try:
-                submission, agent_time = await self.messenger.talk_to_agent(
-                    task_description, agent_url
-                )
-                submission = self._clean_code_submission(submission)
-
-                await updater.update_status(
-                    TaskState.working,
-                    new_agent_text_message(
-                        f"[{idx}/{len(tasks)}] Received submission, evaluating..."
-                    ),
-                )
-
-                # No more circularity, safe to import at top level if needed, but keeping here for scope
-                eval_result = await evaluator.evaluate(task, submission)
-
-                task_result = TaskResult(
-                    task_id=task["id"],
-                    task_title=task["title"],
-                    score=eval_result["score"],
-                    passed=eval_result["passed"],
-                    generated_code=submission,
-                    details=eval_result["details"],
-                    agent_execution_time_seconds=agent_time,
-                )
-                task_results.append(task_result)
-
-            except Exception as e:
-                logger.error(f"Error evaluating task {task['id']}: {e}")
-                task_result = TaskResult(
-                    task_id=task["id"],
-                    task_title=task["title"],
-                    score=0.0,
-                    passed=False,
-                    details={"error": str(e)},
-                )
-                task_results.append(task_result)
-
-        # Compute final results
-        tasks_passed = sum(1 for r in task_results if r.passed)
-        average_score = (
-            sum(r.score for r in task_results) / len(task_results)
-            if task_results
-            else 0.0
-        )
-
-        # Compute execution time statistics
-        execution_times = [
-            r.agent_execution_time_seconds
-            for r in task_results
-            if r.agent_execution_time_seconds is not None
-        ]
-        total_execution_time = sum(execution_times) if execution_times else None
-        average_execution_time = (
-            total_execution_time / len(execution_times) if execution_times else None
-        )
+                try:
+                    submission, agent_time = await self.messenger.talk_to_agent(
+                        task_description, agent_url
+                    )
+                    submission = self._clean_code_submission(submission)
+
+                    eval_result = await evaluator.evaluate(task, submission)
+
+                    # Fields come from our own evaluator, so skip revalidation
+                    return TaskResult.model_construct(
+                        task_id=task["id"],
+                        task_title=task["title"],
+                        score=eval_result["score"],
+                        passed=eval_result["passed"],
+                        generated_code=submission,
+                        details=eval_result["details"],
+                        agent_execution_time_seconds=agent_time,
+                    )
+
+                except Exception as e:
+                    logger.error(f"Error evaluating task {task['id']}: {e}")
+                    return TaskResult.model_construct(
+                        task_id=task["id"],
+                        task_title=task["title"],
+                        score=0.0,
+                        passed=False,
+                        details={"error": str(e)},
+                    )
+                finally:
+                    progress["done"] += 1
+                    progress["last_title"] = task["title"]
+
+        await self.messenger.prewarm(agent_url)
+
+        pump = asyncio.create_task(self._progress_pump(updater, progress))
+        start_time = time.perf_counter()
+        try:
+            task_results = await asyncio.gather(*[_run_one(task) for task in tasks])
+            wall_clock_time = time.perf_counter() - start_time
+        finally:
+            pump.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await pump
+        # The pump only wakes every interval, so report the final state
+        await self._emit_progress(updater, progress)
+
+        # Compute final results and execution time statistics in one pass
+        num_results = len(task_results)
+        tasks_passed = 0
+        total_score = 0.0
+        total_execution_time = 0.0
+        num_timed = 0
+        for r in task_results:
+            if r.passed:
+                tasks_passed += 1
+            total_score += r.score
+            if r.agent_execution_time_seconds is not None:
+                total_execution_time += r.agent_execution_time_seconds
+                num_timed += 1
+
+        average_score = total_score / num_results if num_results else 0.0
+        if num_timed:
+            average_execution_time = total_execution_time / num_timed
+        else:
+            total_execution_time = average_execution_time = None
 
         benchmark_result = BenchmarkResult(
-            total_tasks=len(task_results),
+            total_tasks=num_results,
             tasks_passed=tasks_passed,
-            tasks_failed=len(task_results) - tasks_passed,
+            tasks_failed=num_results - tasks_passed,
             average_score=average_score,
             task_results=task_results,
             total_execution_time_seconds=total_execution_time,
             average_execution_time_seconds=average_execution_time,
+            wall_clock_time_seconds=wall_clock_time,
         )
 
         summary = self.reporter.generate_summary(benchmark_result)
         await updater.update_status(TaskState.working, new_agent_text_message(summary))
-        await self.reporter.add_artifacts(updater, benchmark_result, summary)
+        await self.reporter.add_artifacts(
+            updater,
+            benchmark_result,
+            summary,
+            include_code=request_config.get("include_code_in_summary", True),
+        )
 
         return benchmark_result
@@ -1,5 +1,6 @@
 """Reporting and artifact management for the Code Agent Benchmark."""
 
+import orjson
 from a2a.server.tasks import TaskUpdater
 from a2a.types import Part, TextPart, DataPart
 from models import BenchmarkResult
@@ -11,7 +12,8 @@ class BenchmarkReporter:
     @staticmethod
     def generate_summary(benchmark_result: BenchmarkResult) -> str:
         """Create a human-readable summary of the benchmark results."""
-        summary = f"""
+        parts = [
+            f"""
 Benchmark Complete!
 
 Results:
@@ -20,32 +22,47 @@ Results:
 - Failed: {benchmark_result.tasks_failed}
 - Average Score: {benchmark_result.average_score:.2%}
 """
-        
+        ]
+
         # Add execution time statistics if available
+        if benchmark_result.wall_clock_time_seconds is not None:
+            parts.append(f"- Wall-Clock Time: {benchmark_result.wall_clock_time_seconds:.2f}s\n")
         if benchmark_result.total_execution_time_seconds is not None:
-            summary += f"- Total Execution Time: {benchmark_result.total_execution_time_seconds:.2f}s\n"
+            # Tasks run concurrently, so their agent times overlap
+            parts.append(f"- Total Agent Time (sum over tasks): {benchmark_result.total_execution_time_seconds:.2f}s\n")
         if benchmark_result.average_execution_time_seconds is not None:
-            summary += f"- Average Execution Time per Task: {benchmark_result.average_execution_time_seconds:.2f}s\n"
-        
-        summary += "\nTask Breakdown:\n"
+            parts.append(f"- Average Execution Time per Task: {benchmark_result.average_execution_time_seconds:.2f}s\n")
+
+        parts.append("\nTask Breakdown:\n")
         for result in benchmark_result.task_results:
             status = "✓" if result.passed else "✗"
             time_str = ""
             if result.agent_execution_time_seconds is not None:
                 time_str = f" ({result.agent_execution_time_seconds:.2f}s)"
-            summary += f"\n{status} {result.task_title}: {result.score:.2%}{time_str}"
+            parts.append(f"\n{status} {result.task_title}: {result.score:.2%}{time_str}")
 
-        return summary
+        # Join once instead of growing the string per task
+        return "".join(parts)
 
     @staticmethod
     async def add_artifacts(
-        updater: TaskUpdater, benchmark_result: BenchmarkResult, summary: str
+        updater: TaskUpdater,
+        benchmark_result: BenchmarkResult,
+        summary: str,
+        include_code: bool = True,
     ):
-        """Add benchmark result artifacts to the task updater."""
+        """Add benchmark result artifacts to the task updater.
+
+        When include_code is False, each task's generated_code is left out of
+        the data artifact to keep it small on large runs.
+        """
+        exclude = None if include_code else {"task_results": {"__all__": {"generated_code"}}}
+        # Serialize once in pydantic's Rust core, then decode to plain JSON types
+        data = orjson.loads(benchmark_result.model_dump_json(exclude=exclude))
         await updater.add_artifact(
             parts=[
                 Part(root=TextPart(text=summary)),
-                Part(root=DataPart(data=benchmark_result.model_dump())),
+                Part(root=DataPart(data=data)),
             ],
             name="Benchmark Results",
         )
@@ -1,8 +1,13 @@
 """Code generation evaluator."""
 
+import asyncio
 import logging
+import os
 from typing import Dict, Any
 from pathlib import Path
+
+import orjson
+
 from evaluators.base import BaseEvaluator
 from utils.test_runner import TestRunner
 
@@ -10,10 +15,26 @@ from utils.test_runner import TestRunner
 logger = logging.getLogger("code_gen_evaluator")
 
 
+def _dump_debug(
+    debug_dir: Path, task_id: str, submission: str, test_code: str, test_output: str
+) -> None:
+    """Write the generated code, test code and test output to one debug file."""
+    debug_dir.mkdir(exist_ok=True, parents=True)
+    artifact = {
+        "task_id": task_id,
+        "generated_code": submission,
+        "test_code": test_code,
+        "test_output": test_output,
+    }
+    data = orjson.dumps(artifact, option=orjson.OPT_INDENT_2)
+    (debug_dir / f"{task_id}.json").write_bytes(data)
+
+
 class CodeGenerationEvaluator(BaseEvaluator):
     """Evaluator for code generation tasks."""
 
-    def __init__(self):
+    def __init__(self, debug: bool = False):
+        self.debug = debug
         self.test_runner = TestRunner()
 
     async def evaluate(self, task: Dict[str, Any], submission: str) -> Dict[str, Any]:
@@ -28,13 +49,11 @@ class CodeGenerationEvaluator(BaseEvaluator):
         test_code = task.get("test_code", "")
 
         # Check if submission is a file path
-        import os
-
-        if os.path.exists(submission) and submission.endswith(".py"):
+        if submission.endswith(".py") and os.path.exists(submission):
             logger.info(f"Reading code from file: {submission}")
             try:
-                with open(submission, "r") as f:
-                    code_content = f.read()
+                # Read off the event loop so concurrent evaluations keep running
+                code_content = await asyncio.to_thread(Path(submission).read_text)
                 logger.info(f"Read {len(code_content)} characters from file")
                 submission = code_content
             except Exception as e:
@@ -51,36 +70,31 @@ class CodeGenerationEvaluator(BaseEvaluator):
                     },
                 }
 
-        # Save debug artifacts
-        try:
-            debug_dir = Path("debug")
-            debug_dir.mkdir(exist_ok=True, parents=True)
-
-            task_id = task["id"]
-            # Save generated code
-            with open(debug_dir / f"{task_id}_generated.py", "w") as f:
-                f.write(submission)
-
-            # Save test code
-            with open(debug_dir / f"{task_id}_test.py", "w") as f:
-                f.write(test_code)
-
-            logger.info(f"Saved debug files to {debug_dir}")
-        except Exception as e:
-            logger.warning(f"Failed to save debug files: {e}")
-
         # Run tests
         logger.info(f"Running tests for task {task['id']}")
-        test_results = self.test_runner.run_tests(
-            submission, test_code, entry_point=task.get("entry_point", "task_func")
+        # Offload the blocking pytest subprocess so concurrent evaluations overlap
+        test_results = await asyncio.to_thread(
+            self.test_runner.run_tests,
+            submission,
+            test_code,
+            entry_point=task.get("entry_point", "task_func"),
         )
 
-        # Save test output
-        try:
-            with open(debug_dir / f"{task_id}_results.txt", "w") as f:
-                f.write(test_results["output"])
-        except Exception:
-            pass
+        # Save debug artifacts off the event loop (opt-in)
+        if self.debug:
+            debug_dir = Path("debug")
+            try:
+                await asyncio.to_thread(
+                    _dump_debug,
+                    debug_dir,
+                    task["id"],
+                    submission,
+                    test_code,
+                    test_results["output"],
+                )
+                logger.info(f"Saved debug file to {debug_dir}")
+            except Exception as e:
+                logger.warning(f"Failed to save debug files: {e}")
 
         # Calculate scores
         tests_passed = test_results["passed"]
@@ -15,6 +15,7 @@ from a2a.utils import (
 from a2a.utils.errors import ServerError
 
 from agent import Agent
+from utils.bigcodebench_loader import BigCodeBenchLoader
 
 
 TERMINAL_STATES = {
@@ -26,9 +27,16 @@ TERMINAL_STATES = {
 
 
 class Executor(AgentExecutor):
-    def __init__(self, model: str = None):
+    def __init__(self, model: str = None, debug: bool = False):
         self.agents: dict[str, Agent] = {}
         self.model = model
+        self.debug = debug
+        # Load and format the dataset once at server start and share it
+        # across agents, so creating one per context does no dataset work
+        self.bigcodebench_loader = BigCodeBenchLoader()
+        self.bigcodebench_tasks = self.bigcodebench_loader.load_tasks(limit=None)
+        # Build the default stdlib-only subset too; the loader keeps it
+        self.bigcodebench_loader.load_stdlib_tasks()
 
     async def execute(self, context: RequestContext, event_queue: EventQueue) -> None:
         msg = context.message
@@ -56,7 +64,12 @@ class Executor(AgentExecutor):
         try:
             agent = self.agents.get(context_id)
             if not agent:
-                agent = Agent(model=self.model)
+                agent = Agent(
+                    model=self.model,
+                    debug=self.debug,
+                    bigcodebench_loader=self.bigcodebench_loader,
+                    bigcodebench_tasks=self.bigcodebench_tasks,
+                )
                 self.agents[context_id] = agent
 
             await agent.run(msg, updater)
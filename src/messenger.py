@@ -2,6 +2,7 @@
 
 import time
 import httpx
+import orjson
 from a2a.utils import new_task, new_agent_text_message
 
 
@@ -9,8 +10,23 @@ class Messenger:
     """A2A client for communicating with purple agents."""
 
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=300.0)
+        # One shared client for all tasks: HTTP/2 multiplexes concurrent
+        # requests over a single pooled connection per agent.
+        self.client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(300.0, connect=10.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
         self.active_tasks: dict[str, str] = {}
+        # Normalized endpoint per agent URL, reused across tasks
+        self._url_cache: dict[str, str] = {}
+
+    def _endpoint(self, agent_url: str) -> str:
+        """Return the agent URL with exactly one trailing slash."""
+        url = self._url_cache.get(agent_url)
+        if url is None:
+            url = self._url_cache[agent_url] = f"{agent_url.rstrip('/')}/"
+        return url
 
     async def talk_to_agent(self, prompt: str, agent_url: str) -> tuple[str, float]:
         """Send a message to an agent and get the response text and execution time.
@@ -34,7 +50,7 @@ class Messenger:
         # Track execution time
         start_time = time.time()
         response = await self.client.post(
-            f"{agent_url.rstrip('/')}/",
+            self._endpoint(agent_url),
             json=payload,
         )
         execution_time = time.time() - start_time
@@ -42,24 +58,35 @@ class Messenger:
         response.raise_for_status()
 
         # Extract text from response (could be code or file path)
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         result = response_data.get("result")
         if not result:
             return "", execution_time
 
         # Result can be a Message or a Task according to A2A spec
-        # Handle Task (standard for many A2A scenarios)
-        if "status" in result and result["status"].get("message"):
-            result = result["status"]["message"]
+        # Handle Task (standard for many A2A scenarios) via its status message,
+        # otherwise treat the result itself as a Message
+        result = (result.get("status") or {}).get("message") or result
 
-        # Handle Message (or Task's status message)
-        if "parts" in result:
-            for part in result["parts"]:
-                if "text" in part:
-                    return part["text"], execution_time
+        for part in result.get("parts", ()):
+            if "text" in part:
+                return part["text"], execution_time
 
         return "", execution_time
 
+    async def prewarm(self, agent_url: str) -> None:
+        """Open a pooled connection to the agent ahead of the first task."""
+        try:
+            # Short timeout so a slow agent cannot hold up the benchmark here
+            await self.client.head(
+                self._endpoint(agent_url), timeout=httpx.Timeout(5.0, connect=5.0)
+            )
+        except Exception:
+            # Best effort only; the first real request will connect anyway.
+            # Catch everything: a bad URL raises InvalidURL, not an HTTPError,
+            # and should fail each task rather than the whole run
+            pass
+
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
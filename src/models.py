@@ -31,5 +31,9 @@ class BenchmarkResult(BaseModel):
     tasks_failed: int
     average_score: float
     task_results: List[TaskResult]
+    # Sum and mean of the per-task agent latencies; with concurrent tasks
+    # these overlap, so the sum can exceed the run's wall-clock time
     total_execution_time_seconds: Optional[float] = None
     average_execution_time_seconds: Optional[float] = None
+    # Time taken to run every task, start to finish
+    wall_clock_time_seconds: Optional[float] = None
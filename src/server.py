@@ -28,6 +28,11 @@ def main():
         default=None,
         help="LLM model to use for evaluation (optional)",
     )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Save generated code, tests and test output to debug/ for each task",
+    )
     args = parser.parse_args()
 
     skill = AgentSkill(
@@ -62,7 +67,7 @@ def main():
     )
 
     request_handler = DefaultRequestHandler(
-        agent_executor=Executor(model=args.model),
+        agent_executor=Executor(model=args.model, debug=args.debug),
         task_store=InMemoryTaskStore(),
     )
     server = A2AStarletteApplication(
@@ -1,8 +1,163 @@
 """BigCodeBench task loader for AgentBeats framework."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import ast
-from datasets import load_dataset
+import bisect
+import functools
+import hashlib
+import json
+import os
+from collections import Counter
+import numpy as np
+import pyarrow.compute as pc
+from datasets import Dataset, Features, Sequence, Value, load_dataset
+from utils.stdlib_filter import PYTHON_STDLIB
+
+# Difficulty heuristic: more libraries, longer solutions and more thorough
+# tests each suggest a more complex task
+_LIBS_THRESHOLDS = (2, 3)
+_SOLUTION_THRESHOLDS = (250, 500)
+_TEST_THRESHOLDS = (2000,)
+# Indexed by complexity score, 0 through 5
+_DIFFICULTY_BY_SCORE = ("easy", "easy", "medium", "medium", "hard", "hard")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_libs_str(libs: str) -> Tuple[str, ...]:
+    """Parse a string-encoded libs list, memoized since many tasks share one."""
+    # BigCodeBench stores libs as a Python repr like "['os', 're']". Without
+    # escapes or double quotes, swapping the quotes yields equivalent JSON,
+    # which parses far faster than ast.literal_eval. Only a list of strings
+    # is trusted, since JSON also accepts tokens like true/null/NaN.
+    parsed = None
+    if "\\" not in libs and '"' not in libs:
+        try:
+            parsed = json.loads(libs.replace("'", '"'))
+        except json.JSONDecodeError:
+            pass
+        if not (
+            isinstance(parsed, list) and all(isinstance(lib, str) for lib in parsed)
+        ):
+            parsed = None
+    if parsed is None:
+        try:
+            parsed = ast.literal_eval(libs)
+        except (ValueError, SyntaxError):
+            pass  # Fall through to return empty tuple
+    if isinstance(parsed, list):
+        return tuple(parsed)
+    return ()
+
+
+def _parse_libs(task: Dict[str, Any]) -> List[str]:
+    """
+    Parse the 'libs' field from the task, which can be a list or a string representation of a list.
+    """
+    libs = task.get("libs")
+    if isinstance(libs, list):
+        return libs
+    elif isinstance(libs, str):
+        return list(_parse_libs_str(libs))
+    return []
+
+
+def _is_stdlib_batch(libs_batch: List[Any]) -> List[bool]:
+    """Dataset.filter predicate over a batch of raw libs values."""
+    stdlib = PYTHON_STDLIB
+    return [stdlib.issuperset(_parse_libs({"libs": libs})) for libs in libs_batch]
+
+
+def _format_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert BigCodeBench task to AgentBeats format.
+
+    Kept at module level so datasets.map can pickle it for worker processes.
+
+    Args:
+        task: Raw task from BigCodeBench dataset
+
+    Returns:
+        Task formatted for AgentBeats benchmark
+    """
+    # Extract task ID number for our internal ID
+    task_num = task["task_id"].split("/")[-1]
+    libs = _parse_libs(task)
+
+    return {
+        "id": f"bigcodebench_{task_num}",
+        "original_id": task["task_id"],
+        "category": "code_generation",
+        "difficulty": _estimate_difficulty(task, libs),
+        "title": _extract_title(task),
+        "description": task["instruct_prompt"],
+        "prompt": task["complete_prompt"],
+        "test_code": task["test"],
+        "reference_solution": task["canonical_solution"],
+        "entry_point": task["entry_point"],
+        "required_libs": libs,
+        "metadata": {
+            "time_limit_seconds": 120,  # BigCodeBench tasks can be complex
+            "max_tokens": 2000,
+            "tags": ["bigcodebench", *libs[:3]],  # Use parsed libs for tags
+            "source": "BigCodeBench",
+        },
+    }
+
+
+def _extract_title(task: Dict[str, Any]) -> str:
+    """Extract a short title from the task description."""
+    description = task["instruct_prompt"]
+    # Take first sentence or first 80 chars
+    first_sentence = description.split(".")[0]
+    if len(first_sentence) > 80:
+        return first_sentence[:77] + "..."
+    return first_sentence
+
+
+def _estimate_difficulty(task: Dict[str, Any], libs: List[str]) -> str:
+    """
+    Estimate task difficulty based on heuristics.
+
+    Args:
+        task: Task dictionary
+        libs: The task's libraries, as returned by _parse_libs
+
+    Returns:
+        "easy", "medium", or "hard"
+    """
+    # Each indicator scores the number of thresholds it reaches: at least
+    # 2/3 libraries, or a solution over 250/500 chars and tests over 2000
+    complexity_score = (
+        bisect.bisect_right(_LIBS_THRESHOLDS, len(libs))
+        + bisect.bisect_left(_SOLUTION_THRESHOLDS, len(task["canonical_solution"]))
+        + bisect.bisect_left(_TEST_THRESHOLDS, len(task["test"]))
+    )
+    return _DIFFICULTY_BY_SCORE[complexity_score]
+
+
+# Schema of _format_task output, so datasets.map shards never disagree on
+# inferred types (an empty required_libs list would otherwise infer as null)
+_FORMATTED_FEATURES = Features(
+    {
+        "id": Value("string"),
+        "original_id": Value("string"),
+        "category": Value("string"),
+        "difficulty": Value("string"),
+        "title": Value("string"),
+        "description": Value("string"),
+        "prompt": Value("string"),
+        "test_code": Value("string"),
+        "reference_solution": Value("string"),
+        "entry_point": Value("string"),
+        "required_libs": Sequence(Value("string")),
+        "metadata": {
+            "time_limit_seconds": Value("int64"),
+            "max_tokens": Value("int64"),
+            "tags": Sequence(Value("string")),
+            "source": Value("string"),
+        },
+    }
+)
 
 
 class BigCodeBenchLoader:
@@ -17,12 +172,21 @@ class BigCodeBenchLoader:
         """
         self.dataset = None
         self.cache_dir = cache_dir
+        # task_id -> (split, row index), built on first lookup
+        self._id_index: Optional[Dict[str, Tuple[str, int]]] = None
+        # (split, task_id) -> formatted task; splits reuse IDs across versions
+        self._format_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # split -> formatted stdlib-only tasks, see load_stdlib_tasks
+        self._stdlib_tasks: Dict[str, List[Dict[str, Any]]] = {}
         self._load_dataset()
 
     def _load_dataset(self):
         """Load BigCodeBench dataset from Hugging Face."""
         print("Loading BigCodeBench dataset...")
         self.dataset = load_dataset("bigcode/bigcodebench", cache_dir=self.cache_dir)
+        self._id_index = None
+        self._format_cache = {}
+        self._stdlib_tasks = {}
         print(f"✓ Loaded BigCodeBench with {len(self.dataset['v0.1.2'])} tasks")
 
     def get_task_by_id(self, task_id: str) -> Optional[Dict[str, Any]]:
@@ -35,18 +199,30 @@ class BigCodeBenchLoader:
         Returns:
             Task dictionary or None if not found
         """
-        # Search through all splits
+        if self._id_index is None:
+            self._id_index = self._build_id_index()
+
+        location = self._id_index.get(task_id)
+        if location is None:
+            return None
+        split_name, idx = location
+        return self._format_cached(split_name, self.dataset[split_name][idx])
+
+    def _build_id_index(self) -> Dict[str, Tuple[str, int]]:
+        """Map each task ID to its first (split, row index) across all splits."""
+        index: Dict[str, Tuple[str, int]] = {}
         for split_name in self.dataset.keys():
-            for task in self.dataset[split_name]:
-                if task["task_id"] == task_id:
-                    return self._format_task(task)
-        return None
+            # Read only the task_id column rather than decoding whole rows
+            for idx, tid in enumerate(self.dataset[split_name]["task_id"]):
+                index.setdefault(tid, (split_name, idx))
+        return index
 
     def load_tasks(
         self,
         split: str = "v0.1.2",
         limit: Optional[int] = None,
         task_ids: Optional[List[str]] = None,
+        num_proc: int = 1,
     ) -> List[Dict[str, Any]]:
         """
         Load tasks from BigCodeBench.
@@ -55,6 +231,9 @@ class BigCodeBenchLoader:
             split: Dataset split to use (default: v0.1.2, latest version)
             limit: Maximum number of tasks to load
             task_ids: Optional list of specific task IDs to load
+            num_proc: Worker processes for formatting; above 1, rows not yet
+                cached are formatted with datasets.map. Process start-up
+                outweighs the work for a few hundred rows, so default is 1
 
         Returns:
             List of task dictionaries in AgentBeats format
@@ -63,120 +242,103 @@ class BigCodeBenchLoader:
             available = list(self.dataset.keys())
             raise ValueError(f"Split '{split}' not found. Available: {available}")
 
-        tasks = []
-        for idx, task in enumerate(self.dataset[split]):
-            # Filter by task_ids if provided
-            if task_ids and task["task_id"] not in task_ids:
-                continue
+        ds = self.dataset[split]
 
-            tasks.append(self._format_task(task))
+        # Pick rows by index from the task_id column alone, so rejected rows
+        # are never decoded; select() only records an index mapping
+        if task_ids:
+            wanted = set(task_ids)
+            indices = [idx for idx, tid in enumerate(ds["task_id"]) if tid in wanted]
+            ds = ds.select(indices[:limit] if limit else indices)
+        elif limit:
+            ds = ds.select(range(min(limit, len(ds))))
 
-            # Apply limit if specified
-            if limit and len(tasks) >= limit:
-                break
+        if num_proc > 1:
+            self._format_parallel(split, ds, num_proc)
 
-        return tasks
+        return [self._format_cached(split, task) for task in ds]
 
-    def _parse_libs(self, task: Dict[str, Any]) -> List[str]:
-        """
-        Parse the 'libs' field from the task, which can be a list or a string representation of a list.
-        """
-        libs = task.get("libs")
-        if isinstance(libs, list):
-            return libs
-        elif isinstance(libs, str):
-            try:
-                parsed_libs = ast.literal_eval(libs)
-                if isinstance(parsed_libs, list):
-                    return parsed_libs
-            except (ValueError, SyntaxError):
-                pass  # Fall through to return empty list
-        return []
-
-    def _format_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    def load_stdlib_tasks(
+        self, split: str = "v0.1.2", limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Convert BigCodeBench task to AgentBeats format.
+        Load the tasks whose libraries are all in the standard library.
+
+        Same result as filter_stdlib_tasks(load_tasks(split)), but the filter
+        reads only the libs column. For disk-backed splits the filtered rows
+        are written once to an Arrow file beside the dataset cache, keyed by
+        the split fingerprint and PYTHON_STDLIB, so later runs just map it.
+        The formatted list is kept per split, and its dicts are shared with
+        load_tasks, so callers must not mutate them.
 
         Args:
-            task: Raw task from BigCodeBench dataset
+            split: Dataset split to use (default: v0.1.2, latest version)
+            limit: Maximum number of tasks to load
 
         Returns:
-            Task formatted for AgentBeats benchmark
+            List of stdlib-only task dictionaries in AgentBeats format
         """
-        # Extract task ID number for our internal ID
-        task_num = task["task_id"].split("/")[-1]
-
-        return {
-            "id": f"bigcodebench_{task_num}",
-            "original_id": task["task_id"],
-            "category": "code_generation",
-            "difficulty": self._estimate_difficulty(task),
-            "title": self._extract_title(task),
-            "description": task["instruct_prompt"],
-            "prompt": task["complete_prompt"],
-            "test_code": task["test"],
-            "reference_solution": task["canonical_solution"],
-            "entry_point": task["entry_point"],
-            "required_libs": self._parse_libs(task),
-            "metadata": {
-                "time_limit_seconds": 120,  # BigCodeBench tasks can be complex
-                "max_tokens": 2000,
-                "tags": ["bigcodebench"]
-                + (self._parse_libs(task)[:3]),  # Use parsed libs for tags
-                "source": "BigCodeBench",
-            },
-        }
-
-    def _extract_title(self, task: Dict[str, Any]) -> str:
-        """Extract a short title from the task description."""
-        description = task["instruct_prompt"]
-        # Take first sentence or first 80 chars
-        first_sentence = description.split(".")[0]
-        if len(first_sentence) > 80:
-            return first_sentence[:77] + "..."
-        return first_sentence
+        if split not in self.dataset:
+            available = list(self.dataset.keys())
+            raise ValueError(f"Split '{split}' not found. Available: {available}")
 
-    def _estimate_difficulty(self, task: Dict[str, Any]) -> str:
+        # Filter and format once per split; callers get a copy of the list
+        tasks = self._stdlib_tasks.get(split)
+        if tasks is None:
+            ds = self._filter_stdlib(self.dataset[split])
+            tasks = [self._format_cached(split, task) for task in ds]
+            self._stdlib_tasks[split] = tasks
+
+        return tasks[:limit] if limit else list(tasks)
+
+    def _filter_stdlib(self, ds: Dataset) -> Dataset:
+        """Filter a split to stdlib-only rows, caching the result on disk."""
+        cache_file_name = None
+        if ds.cache_files:
+            stdlib_hash = hashlib.sha256(
+                "\n".join(sorted(PYTHON_STDLIB)).encode()
+            ).hexdigest()[:16]
+            cache_dir = os.path.dirname(ds.cache_files[0]["filename"])
+            cache_file_name = os.path.join(
+                cache_dir, f"stdlib_{ds._fingerprint}_{stdlib_hash}.arrow"
+            )
+        return ds.filter(
+            _is_stdlib_batch,
+            input_columns="libs",
+            batched=True,
+            cache_file_name=cache_file_name,
+        )
+
+    def _format_parallel(self, split: str, ds, num_proc: int) -> None:
+        """Fill the format cache for uncached rows of ds across processes."""
+        missing = [
+            idx
+            for idx, tid in enumerate(ds["task_id"])
+            if (split, tid) not in self._format_cache
+        ]
+        if not missing:
+            return
+        formatted = ds.select(missing).map(
+            _format_task,
+            num_proc=min(num_proc, len(missing)),
+            remove_columns=ds.column_names,
+            features=_FORMATTED_FEATURES,
+            load_from_cache_file=False,
+        )
+        for task in formatted.to_list():
+            self._format_cache.setdefault((split, task["original_id"]), task)
+
+    def _format_cached(self, split: str, task: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Estimate task difficulty based on heuristics.
-
-        Args:
-            task: Task dictionary
+        Format a task once per split and return the same dict on later calls.
 
-        Returns:
-            "easy", "medium", or "hard"
+        Callers share the cached dict and must not mutate it.
         """
-        # Heuristics for difficulty estimation
-        num_libs = len(task["libs"])
-        solution_length = len(task["canonical_solution"])
-        test_length = len(task["test"])
-
-        # Simple heuristic based on complexity indicators
-        complexity_score = 0
-
-        # More libraries = potentially more complex
-        if num_libs >= 3:
-            complexity_score += 2
-        elif num_libs >= 2:
-            complexity_score += 1
-
-        # Longer solutions are usually more complex
-        if solution_length > 500:
-            complexity_score += 2
-        elif solution_length > 250:
-            complexity_score += 1
-
-        # More comprehensive tests suggest complexity
-        if test_length > 2000:
-            complexity_score += 1
-
-        # Map score to difficulty
-        if complexity_score >= 4:
-            return "hard"
-        elif complexity_score >= 2:
-            return "medium"
-        else:
-            return "easy"
+        key = (split, task["task_id"])
+        formatted = self._format_cache.get(key)
+        if formatted is None:
+            formatted = self._format_cache[key] = _format_task(task)
+        return formatted
 
     def get_statistics(self, split: str = "v0.1.2") -> Dict[str, Any]:
         """
@@ -188,22 +350,32 @@ class BigCodeBenchLoader:
         Returns:
             Dictionary with statistics
         """
-        tasks = self.load_tasks(split=split)
-
-        # Count by difficulty
-        difficulties = {}
-        for task in tasks:
-            diff = task["difficulty"]
-            difficulties[diff] = difficulties.get(diff, 0) + 1
+        if split not in self.dataset:
+            available = list(self.dataset.keys())
+            raise ValueError(f"Split '{split}' not found. Available: {available}")
 
-        # Get unique libraries
-        all_libs = set()
-        for task in tasks:
-            all_libs.update(task["required_libs"])
+        # Work on the Arrow columns: lengths come from pyarrow.compute and
+        # scores from numpy, so no per-row str objects are created
+        ds = self.dataset[split].with_format("arrow")
+        parsed_libs = [_parse_libs({"libs": libs}) for libs in ds["libs"].to_pylist()]
+        num_libs = np.fromiter(map(len, parsed_libs), dtype=np.int64, count=len(parsed_libs))
+        solution_lengths = pc.utf8_length(ds["canonical_solution"]).to_numpy()
+        test_lengths = pc.utf8_length(ds["test"]).to_numpy()
+
+        scores = (
+            np.searchsorted(_LIBS_THRESHOLDS, num_libs, side="right")
+            + np.searchsorted(_SOLUTION_THRESHOLDS, solution_lengths, side="left")
+            + np.searchsorted(_TEST_THRESHOLDS, test_lengths, side="left")
+        )
+        difficulties = Counter()
+        for score, count in enumerate(np.bincount(scores, minlength=len(_DIFFICULTY_BY_SCORE))):
+            if count:
+                difficulties[_DIFFICULTY_BY_SCORE[score]] += int(count)
+        all_libs = set().union(*parsed_libs)
 
         return {
-            "total_tasks": len(tasks),
-            "difficulties": difficulties,
+            "total_tasks": len(parsed_libs),
+            "difficulties": dict(difficulties),
             "unique_libraries": len(all_libs),
             "common_libraries": sorted(all_libs)[:20],  # Top 20
         }
@@ -0,0 +1,116 @@
+"""
+Persistent pytest worker used by TestRunner.
+
+Started as a script with `python -B -P`, so it imports nothing beyond pytest
+and the standard library, and none of the green agent's code. Each request is
+one JSON line on stdin: {"id", "args", "cwd", "log_file"}. The worker forks a
+child per request and replies with JSON lines on stdout: {"id", "pid"} once
+the child is running, then {"id", "exitcode"} once it has exited.
+"""
+
+import json
+import os
+import select
+import signal
+import sys
+import traceback
+
+import pytest
+
+
+def _send(reply: dict) -> None:
+    """Write one reply line to the runner."""
+    os.write(1, json.dumps(reply).encode() + b"\n")
+
+
+def _run_child(request: dict, wakeup_fds: tuple) -> None:
+    """Run pytest for one request in the forked child; never returns."""
+    code = 3
+    try:
+        for fd in wakeup_fds:
+            os.close(fd)
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        # Own process group, so a timeout also kills what the submission spawned
+        os.setpgid(0, 0)
+        cwd = request["cwd"]
+        os.chdir(cwd)
+        # Same sys.path as `python -m pytest` started in cwd
+        sys.path.insert(0, cwd)
+        stdin = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(stdin, 0)
+        fd = os.open(request["log_file"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(fd, 1)
+        os.dup2(fd, 2)
+        code = pytest.main(request["args"])
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Skip interpreter teardown, which submitted code could stall
+        os._exit(int(code))
+
+
+def _reap(children: dict) -> None:
+    """Report every child that has exited."""
+    while children:
+        try:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        request_id = children.pop(pid, None)
+        if request_id is not None:
+            _send({"id": request_id, "exitcode": os.waitstatus_to_exitcode(status)})
+
+
+def main() -> None:
+    wakeup_r, wakeup_w = os.pipe()
+    os.set_blocking(wakeup_r, False)
+    os.set_blocking(wakeup_w, False)
+    # SIGCHLD only needs to wake select(); children are reaped in the loop
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+    signal.set_wakeup_fd(wakeup_w)
+
+    children = {}  # pid -> request id
+    buffer = b""
+    while True:
+        readable, _, _ = select.select([0, wakeup_r], [], [])
+        if wakeup_r in readable:
+            try:
+                while os.read(wakeup_r, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+            _reap(children)
+        if 0 not in readable:
+            continue
+
+        data = os.read(0, 65536)
+        if not data:
+            # The runner has gone away; nobody is left to read results
+            for pid in children:
+                try:
+                    os.killpg(pid, signal.SIGKILL)
+                except OSError:
+                    pass
+            return
+        *lines, buffer = (buffer + data).split(b"\n")
+        for line in lines:
+            request = json.loads(line)
+            pid = os.fork()
+            if pid == 0:
+                _run_child(request, (wakeup_r, wakeup_w))
+            try:
+                os.setpgid(pid, pid)
+            except OSError:
+                # The child already did it
+                pass
+            children[pid] = request["id"]
+            _send({"id": request["id"], "pid": pid})
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,7 @@
 
 # Python 3.11+ standard library modules
 # Source: https://docs.python.org/3/library/
-PYTHON_STDLIB = {
+PYTHON_STDLIB = frozenset({
     # Built-in functions (always available)
     "__future__",
     "__main__",
@@ -173,7 +173,6 @@ PYTHON_STDLIB = {
     "abc",
     "atexit",
     "traceback",
-    "__future__",
     "gc",
     "inspect",
     "site",
@@ -234,7 +233,7 @@ PYTHON_STDLIB = {
     "telnetlib",
     "uu",
     "xdrlib",
-}
+})
 
 
 def is_stdlib_only(required_libs: list) -> bool:
@@ -247,7 +246,7 @@ def is_stdlib_only(required_libs: list) -> bool:
     Returns:
         True if all libraries are stdlib, False otherwise
     """
-    return all(lib in PYTHON_STDLIB for lib in required_libs)
+    return PYTHON_STDLIB.issuperset(required_libs)
 
 
 def filter_stdlib_tasks(tasks: list) -> list:
@@ -260,4 +259,10 @@ def filter_stdlib_tasks(tasks: list) -> list:
     Returns:
         Filtered list of stdlib-only tasks
     """
-    return [task for task in tasks if is_stdlib_only(task.get("required_libs", []))]
+    stdlib = PYTHON_STDLIB
+    # Many tasks need no libraries at all; skip the set check for those
+    return [
+        task
+        for task in tasks
+        if not (libs := task.get("required_libs")) or stdlib.issuperset(libs)
+    ]
@@ -1,8 +1,37 @@
 """Task loader utility for loading task definitions from JSON files."""
 
-import json
+import mmap
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
+
+import orjson
+
+# Files at least this large are parsed straight from a memory map
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _load_json(path: Union[str, Path]) -> Any:
+    """Parse a JSON file from its raw bytes, skipping the str decode."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            # Avoid copying big files into a bytes object first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        return orjson.loads(f.read())
+
+
+def _category_dirs(tasks_dir: Path) -> List[str]:
+    """List category directories; DirEntry caches the type, saving a stat."""
+    with os.scandir(tasks_dir) as entries:
+        return [entry.path for entry in entries if entry.is_dir()]
+
+
+def _task_files(category_dir: Union[str, Path]) -> List[str]:
+    """List the *.json entries in a directory, as Path.glob would."""
+    with os.scandir(category_dir) as entries:
+        return [entry.path for entry in entries if entry.name.endswith(".json")]
 
 
 class TaskLoader:
@@ -10,20 +39,29 @@ class TaskLoader:
 
     def __init__(self, tasks_dir: str):
         self.tasks_dir = Path(tasks_dir)
+        # task_id -> file path, built on first lookup
+        self._index: Optional[Dict[str, str]] = None
 
     def load_task(self, task_id: str) -> Optional[Dict[str, Any]]:
         """Load a single task by ID."""
-        # Search through all category directories
-        for category_dir in self.tasks_dir.iterdir():
-            if not category_dir.is_dir():
-                continue
+        if self._index is None:
+            self._index = self._build_index()
 
-            for task_file in category_dir.glob("*.json"):
-                task_data = json.loads(task_file.read_text())
-                if task_data.get("id") == task_id:
-                    return task_data
+        task_file = self._index.get(task_id)
+        if task_file is None:
+            return None
+        return _load_json(task_file)
 
-        return None
+    def _build_index(self) -> Dict[str, str]:
+        """Map each task ID to the first file defining it across categories."""
+        index: Dict[str, str] = {}
+        for category_dir in _category_dirs(self.tasks_dir):
+            for task_file in _task_files(category_dir):
+                task_id = _load_json(task_file).get("id")
+                if task_id is not None:
+                    index.setdefault(task_id, task_file)
+
+        return index
 
     def load_tasks_by_category(
         self,
@@ -33,12 +71,12 @@ class TaskLoader:
     ) -> List[Dict[str, Any]]:
         """Load tasks from a specific category."""
         category_dir = self.tasks_dir / category
-        if not category_dir.exists():
+        if not category_dir.is_dir():
             return []
 
         tasks = []
-        for task_file in sorted(category_dir.glob("*.json")):
-            task_data = json.loads(task_file.read_text())
+        for task_file in sorted(_task_files(category_dir)):
+            task_data = _load_json(task_file)
 
             # Filter by difficulty if specified
             if difficulty and task_data.get("difficulty") != difficulty:
@@ -55,12 +93,9 @@ class TaskLoader:
     def load_all_tasks(self) -> List[Dict[str, Any]]:
         """Load all available tasks."""
         tasks = []
-        for category_dir in self.tasks_dir.iterdir():
-            if not category_dir.is_dir():
-                continue
-
-            for task_file in category_dir.glob("*.json"):
-                task_data = json.loads(task_file.read_text())
+        for category_dir in _category_dirs(self.tasks_dir):
+            for task_file in _task_files(category_dir):
+                task_data = _load_json(task_file)
                 tasks.append(task_data)
 
         return tasks
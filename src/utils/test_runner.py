@@ -1,9 +1,150 @@
 """Test runner utility for executing Python code tests."""
 
+import atexit
+import contextlib
+import itertools
+import json
+import os
+import queue
+import shutil
+import signal
 import subprocess
+import sys
 import tempfile
+import threading
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+# Files a run writes into its sandbox; anything else means the submission
+# left state behind and the directory is not reused
+_SANDBOX_FILES = ("solution.py", "test_solution.py", "report.xml", "pytest.log")
+
+# Written into the sandbox on each lend so test files need not embed the
+# directory path
+_CONFTEST_NAME = "conftest.py"
+_CONFTEST = """import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+"""
+_CONFTEST_BYTES = _CONFTEST.encode()
+
+
+_WORKER_SCRIPT = str(Path(__file__).with_name("pytest_worker.py"))
+_WORKER_SUPPORTED = hasattr(os, "fork")
+
+
+class _PytestWorker:
+    """
+    Client for the pytest worker process shared by every TestRunner.
+
+    The worker is a fresh interpreter that imports pytest once and forks a
+    child per run, skipping interpreter start-up and the pytest import while
+    keeping one process per submission. Being its own script, it never
+    imports the server's modules, so the children cannot either.
+    """
+
+    def __init__(self):
+        # -B: sandboxes are reused, so never trust a cached .pyc for
+        # solution.py; -P: keep src/utils off sys.path
+        self._proc = subprocess.Popen(
+            [sys.executable, "-B", "-P", _WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._replies: Dict[int, "queue.SimpleQueue[Optional[Dict[str, int]]]"] = {}
+        self.alive = True
+        threading.Thread(target=self._read_replies, daemon=True).start()
+
+    def _read_replies(self) -> None:
+        """Route each reply line to the run waiting for it."""
+        for line in self._proc.stdout:
+            reply = json.loads(line)
+            replies = self._replies.get(reply["id"])
+            if replies is not None:
+                replies.put(reply)
+        # The worker died; fail every pending run
+        with self._lock:
+            self.alive = False
+            for replies in self._replies.values():
+                replies.put(None)
+        self._proc.wait()
+
+    def run(self, args: List[str], cwd: str, log_file: str, timeout: float) -> int:
+        """Run pytest in a forked child and return its exit code."""
+        replies: "queue.SimpleQueue[Optional[Dict[str, int]]]" = queue.SimpleQueue()
+        request = {"args": args, "cwd": cwd, "log_file": log_file}
+        with self._lock:
+            if not self.alive:
+                raise RuntimeError("pytest worker exited")
+            request["id"] = request_id = next(self._ids)
+            self._replies[request_id] = replies
+            self._proc.stdin.write(json.dumps(request).encode() + b"\n")
+            self._proc.stdin.flush()
+        try:
+            started = replies.get()
+            if started is None:
+                raise RuntimeError("pytest worker exited")
+            try:
+                finished = replies.get(timeout=timeout)
+            except queue.Empty:
+                # The child leads its own process group; kill all of it
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(started["pid"], signal.SIGKILL)
+                replies.get()
+                raise subprocess.TimeoutExpired(args, timeout)
+            if finished is None:
+                raise RuntimeError("pytest worker exited")
+            return finished["exitcode"]
+        finally:
+            with self._lock:
+                del self._replies[request_id]
+
+
+_worker_lock = threading.Lock()
+_worker: Optional[_PytestWorker] = None
+
+
+def _get_worker() -> _PytestWorker:
+    """Return the shared pytest worker, (re)starting it if needed."""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.alive:
+            _worker = _PytestWorker()
+        return _worker
+
+
+def _parse_junit_report(report_file: Path) -> Tuple[int, int, List[str]]:
+    """
+    Count outcomes from a pytest JUnit XML report.
+
+    Returns:
+        (num_passed, num_failed, errors); a testcase with a failure or error
+        child counts as failed once, and skipped testcases are not counted
+    """
+    num_passed = 0
+    num_failed = 0
+    errors = []
+    for _, elem in ET.iterparse(report_file):
+        if elem.tag != "testcase":
+            continue
+        problems = [child for child in elem if child.tag in ("failure", "error")]
+        if problems:
+            num_failed += 1
+            name = elem.get("name", "")
+            classname = elem.get("classname")
+            node = f"{classname}::{name}" if classname else name
+            for child in problems:
+                kind = "FAILED" if child.tag == "failure" else "ERROR"
+                message = (child.get("message") or "").split("\n", 1)[0]
+                errors.append(f"{kind} {node} - {message}")
+        elif elem.find("skipped") is None:
+            num_passed += 1
+        elem.clear()
+    return num_passed, num_failed, errors
 
 
 class TestRunner:
@@ -11,6 +152,54 @@ class TestRunner:
 
     def __init__(self):
         self.timeout = 60
+        # Idle sandbox directories; concurrent runs each take their own
+        self._free_sandboxes: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        atexit.register(self._remove_sandboxes)
+
+    @contextlib.contextmanager
+    def _sandbox(self) -> Iterator[str]:
+        """Lend a directory holding only conftest.py, creating one if none is idle."""
+        try:
+            tmpdir = self._free_sandboxes.get_nowait()
+        except queue.Empty:
+            tmpdir = tempfile.mkdtemp(prefix="test_runner_")
+        # Always write it fresh rather than trusting what a previous run left
+        Path(tmpdir, _CONFTEST_NAME).write_bytes(_CONFTEST_BYTES)
+        try:
+            yield tmpdir
+        finally:
+            for name in _SANDBOX_FILES:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(os.path.join(tmpdir, name))
+            if self._is_reusable(tmpdir):
+                self._free_sandboxes.put(tmpdir)
+            else:
+                shutil.rmtree(tmpdir, ignore_errors=True)
+
+    @staticmethod
+    def _is_reusable(tmpdir: str) -> bool:
+        """Check a sandbox holds only our conftest.py, byte for byte."""
+        # A submission can rewrite conftest.py (e.g. with hooks that force
+        # outcomes), which would then apply to whichever run reuses the dir
+        try:
+            with os.scandir(tmpdir) as entries:
+                entries = list(entries)
+            if len(entries) != 1 or entries[0].name != _CONFTEST_NAME:
+                return False
+            if not entries[0].is_file(follow_symlinks=False):
+                return False
+            return Path(entries[0].path).read_bytes() == _CONFTEST_BYTES
+        except OSError:
+            return False
+
+    def _remove_sandboxes(self) -> None:
+        """Delete idle sandbox directories at interpreter exit."""
+        while True:
+            try:
+                tmpdir = self._free_sandboxes.get_nowait()
+            except queue.Empty:
+                return
+            shutil.rmtree(tmpdir, ignore_errors=True)
 
     def run_tests(self, code: str, test_code: str, entry_point: str = "task_func") -> Dict[str, Any]:
         """
@@ -29,7 +218,7 @@ class TestRunner:
             - errors: list of error messages
             - output: stdout/stderr
         """
-        with tempfile.TemporaryDirectory() as tmpdir:
+        with self._sandbox() as tmpdir:
             tmpdir_path = Path(tmpdir)
 
             # Write code to file
@@ -51,48 +240,48 @@ if '{entry_point}' in globals() and 'task_func' not in globals():
 if 'task_func' in globals() and '{entry_point}' not in globals():
     {entry_point} = task_func
 """
-            test_content = f"""import sys
-sys.path.insert(0, '{tmpdir}')
-{aliasing}
+            test_content = f"""{aliasing}
 
 {test_code}
 """
             test_file.write_text(test_content)
+            report_file = tmpdir_path / "report.xml"
+
+            args = [
+                str(test_file), "-q", "--tb=line",
+                "-p", "no:cacheprovider", f"--junitxml={report_file}",
+            ]
 
-            # Run pytest
             try:
-                result = subprocess.run(
-                    ["python", "-m", "pytest", str(test_file), "-v", "--tb=short"],
-                    capture_output=True,
-                    text=True,
-                    timeout=self.timeout,
-                    cwd=tmpdir,
-                )
-
-                output = result.stdout + result.stderr
-                passed = result.returncode == 0
-
-                # Parse pytest output for counts
-                num_passed = output.count(" PASSED")
-                num_failed = output.count(" FAILED")
-
-                errors = []
-                if not passed:
-                    # Extract error messages
-                    lines = output.split("\n")
-                    for i, line in enumerate(lines):
-                        if "FAILED" in line or "ERROR" in line:
-                            errors.append(line)
+                if _WORKER_SUPPORTED:
+                    returncode, output = self._run_forked(args, tmpdir)
+                else:
+                    returncode, output = self._run_subprocess(args, tmpdir)
+
+                passed = returncode == 0
+
+                # Read counts from the report instead of scanning the output
+                try:
+                    num_passed, num_failed, errors = _parse_junit_report(report_file)
+                except (OSError, ET.ParseError):
+                    # pytest died before writing a complete report
+                    num_passed, num_failed, errors = 0, 0, []
+                if not passed and not errors:
+                    errors.append(f"pytest exited with code {returncode}")
 
                 return {
                     "passed": passed,
                     "num_passed": num_passed,
                     "num_failed": num_failed,
                     "errors": errors,
-                    "output": output,
+                    # Output only helps diagnose failures
+                    "output": "" if passed else output,
                 }
 
             except subprocess.TimeoutExpired:
+                # Processes spawned by the submission may outlive the kill,
+                # so drop the directory rather than hand it to another run
+                shutil.rmtree(tmpdir, ignore_errors=True)
                 return {
                     "passed": False,
                     "num_passed": 0,
@@ -108,3 +297,26 @@ sys.path.insert(0, '{tmpdir}')
                     "errors": [f"Test execution error: {str(e)}"],
                     "output": "",
                 }
+
+    def _run_forked(self, args: List[str], tmpdir: str) -> Tuple[int, str]:
+        """Run pytest in a child of the pytest worker; returns (exit code, output)."""
+        log_file = os.path.join(tmpdir, "pytest.log")
+        returncode = _get_worker().run(args, tmpdir, log_file, self.timeout)
+        if returncode == 0:
+            return returncode, ""
+        try:
+            output = Path(log_file).read_text(errors="replace")
+        except OSError:
+            output = ""
+        return returncode, output
+
+    def _run_subprocess(self, args: List[str], tmpdir: str) -> Tuple[int, str]:
+        """Run pytest in a new interpreter; returns (exit code, output)."""
+        result = subprocess.run(
+            ["python", "-B", "-m", "pytest", *args],
+            capture_output=True,
+            text=True,
+            timeout=self.timeout,
+            cwd=tmpdir,
+        )
+        return result.returncode, result.stdout + result.stderr
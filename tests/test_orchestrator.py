@@ -0,0 +1,131 @@
+"""Unit tests for BenchmarkOrchestrator request handling and progress."""
+
+import asyncio
+
+import pytest
+
+from components.orchestrator import BenchmarkOrchestrator
+
+
+class FakeMessenger:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def prewarm(self, agent_url):
+        pass
+
+    async def talk_to_agent(self, message, agent_url):
+        await asyncio.sleep(self.delay)
+        return "def task_func():\n    return 1\n", self.delay
+
+
+class FakeEvaluator:
+    async def evaluate(self, task, submission):
+        return {"score": 1.0, "passed": True, "details": {}}
+
+
+class FakeTaskLoader:
+    def load_tasks_by_category(self, category, difficulty=None, limit=None):
+        return [
+            {
+                "id": f"task_{i}",
+                "title": f"Task {i}",
+                "description": "Return one.",
+                "prompt": "def task_func():",
+                "entry_point": "task_func",
+            }
+            for i in range(limit)
+        ]
+
+
+class FakeUpdater:
+    def __init__(self):
+        self.messages = []
+
+    async def update_status(self, state, message):
+        self.messages.append(message.parts[0].root.text)
+
+    async def add_artifact(self, parts, name):
+        pass
+
+
+def make_orchestrator(delay: float = 0.0) -> BenchmarkOrchestrator:
+    return BenchmarkOrchestrator(
+        evaluator_map={"code_generation": FakeEvaluator()},
+        messenger=FakeMessenger(delay),
+        task_loader=FakeTaskLoader(),
+        bigcodebench_loader=None,
+    )
+
+
+def run_benchmark(orchestrator, config, updater):
+    return asyncio.run(
+        orchestrator.run_benchmark(config, {"code_agent": "http://agent"}, updater)
+    )
+
+
+@pytest.mark.parametrize("concurrency", [0, -1, 1.5, "4", True, None])
+def test_invalid_concurrency_is_rejected(concurrency):
+    config = {"source": "local", "num_tasks": 2, "concurrency": concurrency}
+    with pytest.raises(ValueError, match="concurrency"):
+        run_benchmark(make_orchestrator(), config, FakeUpdater())
+
+
+def test_concurrency_of_one_runs_every_task():
+    config = {"source": "local", "num_tasks": 3, "concurrency": 1}
+    result = run_benchmark(make_orchestrator(), config, FakeUpdater())
+    assert result.total_tasks == 3
+    assert result.tasks_passed == 3
+
+
+def test_wall_clock_time_is_reported_apart_from_summed_agent_time():
+    """Concurrent tasks overlap, so the run takes less than their summed times."""
+    updater = FakeUpdater()
+    config = {"source": "local", "num_tasks": 4, "concurrency": 4}
+    result = run_benchmark(make_orchestrator(delay=0.3), config, updater)
+
+    assert result.total_execution_time_seconds == pytest.approx(1.2)
+    assert result.wall_clock_time_seconds < result.total_execution_time_seconds
+    summary = next(m for m in updater.messages if m.lstrip().startswith("Benchmark Complete"))
+    assert "- Wall-Clock Time: " in summary
+    assert "- Total Agent Time (sum over tasks): 1.20s" in summary
+
+
+def progress_messages(updater):
+    return [m for m in updater.messages if "Tasks evaluated" in m]
+
+
+def test_short_run_still_reports_final_progress():
+    """A run finishing before the pump's first tick still reports progress."""
+    updater = FakeUpdater()
+    run_benchmark(make_orchestrator(), {"source": "local", "num_tasks": 3}, updater)
+
+    messages = progress_messages(updater)
+    assert messages
+    assert "[3/3] Tasks evaluated" in messages[-1]
+
+
+def test_long_run_reports_last_state_once():
+    """The final flush sends [total/total] without repeating a sent update."""
+    updater = FakeUpdater()
+    config = {"source": "local", "num_tasks": 4, "concurrency": 1}
+    run_benchmark(make_orchestrator(delay=0.3), config, updater)
+
+    messages = progress_messages(updater)
+    assert "[4/4] Tasks evaluated" in messages[-1]
+    assert len(messages) == len(set(messages))
+
+
+def test_task_count_is_announced_exactly_once():
+    """The first progress update, even the final flush, carries the count."""
+    for config, delay in [
+        ({"source": "local", "num_tasks": 3}, 0.0),
+        ({"source": "local", "num_tasks": 4, "concurrency": 1}, 0.3),
+    ]:
+        updater = FakeUpdater()
+        run_benchmark(make_orchestrator(delay), config, updater)
+
+        messages = progress_messages(updater)
+        total = config["num_tasks"]
+        assert messages[0].startswith(f"Loaded {total} tasks. ")
+        assert sum("Loaded" in m for m in messages) == 1
@@ -0,0 +1,201 @@
+"""Unit tests for the sandboxed pytest runner used to score submissions."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from utils import test_runner
+
+
+# Overwrites the sandbox conftest.py with a hook forcing every test to pass
+FORCE_PASS_SUBMISSION = '''
+import os
+
+with open(os.path.join(os.path.dirname(__file__), "conftest.py"), "w") as f:
+    f.write("""
+import pytest
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    outcome.get_result().outcome = "passed"
+""")
+
+def task_func():
+    return 1
+'''
+
+TASK_TESTS = """
+def test_returns_one():
+    assert task_func() == 1
+"""
+
+
+@pytest.fixture
+def runner():
+    return test_runner.TestRunner()
+
+
+def test_rewritten_conftest_does_not_leak_into_next_run(runner):
+    """A sandbox whose conftest.py was tampered with is never reused."""
+    runner.run_tests(FORCE_PASS_SUBMISSION, TASK_TESTS)
+
+    results = runner.run_tests("def task_func():\n    return 0\n", TASK_TESTS)
+
+    assert not results["passed"]
+    assert results["num_failed"] == 1
+
+
+def test_sandbox_conftest_is_restored_on_lend(runner):
+    """Each run sees the runner's conftest.py, even in a reused sandbox."""
+    with runner._sandbox() as tmpdir:
+        pass
+    (Path(tmpdir) / "conftest.py").write_text("raise SystemExit\n")
+    runner._free_sandboxes.put(tmpdir)
+
+    with runner._sandbox() as lent:
+        conftest = (Path(lent) / "conftest.py").read_bytes()
+
+    assert lent == tmpdir
+    assert conftest == test_runner._CONFTEST_BYTES
+
+
+def test_submissions_cannot_import_agent_modules(runner):
+    """Runs see a fresh interpreter's sys.path, not the server's."""
+    tests = """
+import importlib
+
+import pytest
+
+@pytest.mark.parametrize("name", ["models", "utils.test_runner", "components.orchestrator"])
+def test_not_importable(name):
+    with pytest.raises(ModuleNotFoundError):
+        importlib.import_module(name)
+"""
+    results = runner.run_tests("def task_func():\n    return 1\n", tests)
+
+    assert results["passed"], results["errors"]
+    assert results["num_passed"] == 3
+
+
+# Stands in for src/server.py: its top level has a side effect (a real server
+# would import a2a, datasets, ...), so it must run in the server process only
+ENTRY_SCRIPT = """
+import sys
+
+with open(sys.argv[1], "a") as f:
+    f.write("ran\\n")
+
+from utils import test_runner
+
+if __name__ == "__main__":
+    runner = test_runner.TestRunner()
+    for _ in range(2):
+        results = runner.run_tests("def task_func():\\n    return 1\\n", {tests!r})
+        assert results["passed"], results
+"""
+
+
+def test_runs_do_not_execute_entry_script(tmp_path):
+    """Runs never re-run the top level of the server's __main__."""
+    script = tmp_path / "entry.py"
+    script.write_text(ENTRY_SCRIPT.format(tests=TASK_TESTS))
+    marker = tmp_path / "marker"
+    src = Path(test_runner.__file__).resolve().parents[1]
+
+    subprocess.run(
+        [sys.executable, str(script), str(marker)],
+        check=True,
+        timeout=120,
+        env={**os.environ, "PYTHONPATH": str(src)},
+    )
+
+    assert marker.read_text() == "ran\n"
+
+
+def test_passing_run_counts_tests_and_drops_output(runner):
+    results = runner.run_tests("def task_func():\n    return 1\n", TASK_TESTS)
+
+    assert results == {
+        "passed": True,
+        "num_passed": 1,
+        "num_failed": 0,
+        "errors": [],
+        "output": "",
+    }
+
+
+def test_failing_run_reports_each_failure(runner):
+    tests = TASK_TESTS + """
+def test_returns_two():
+    assert task_func() == 2
+"""
+    results = runner.run_tests("def task_func():\n    return 1\n", tests)
+
+    assert not results["passed"]
+    assert results["num_passed"] == 1
+    assert results["num_failed"] == 1
+    assert len(results["errors"]) == 1
+    assert results["errors"][0].startswith("FAILED test_solution::test_returns_two")
+    assert results["output"]
+
+
+def test_entry_point_is_aliased_to_task_func(runner):
+    results = runner.run_tests("def solve():\n    return 1\n", TASK_TESTS, entry_point="solve")
+
+    assert results["passed"]
+
+
+def test_collection_error_counts_as_one_failure(runner):
+    results = runner.run_tests("def task_func(:\n", TASK_TESTS)
+
+    assert not results["passed"]
+    assert results["num_passed"] == 0
+    assert results["num_failed"] == 1
+    assert results["errors"] == ["ERROR test_solution - collection failure"]
+    assert "SyntaxError" in results["output"]
+
+
+def test_timeout_is_reported_and_sandbox_dropped(runner):
+    runner.timeout = 1
+    code = "import time\n\ndef task_func():\n    time.sleep(10)\n"
+
+    results = runner.run_tests(code, TASK_TESTS)
+
+    assert results == {
+        "passed": False,
+        "num_passed": 0,
+        "num_failed": -1,
+        "errors": ["Test execution timed out after 1s"],
+        "output": "",
+    }
+    assert runner._free_sandboxes.empty()
+
+
+def test_junit_report_counts_testcases_once(tmp_path):
+    """Failure plus teardown error is one failed test; skips don't count."""
+    report = tmp_path / "report.xml"
+    report.write_text(
+        '<testsuites><testsuite name="pytest">'
+        '<testcase classname="test_solution" name="test_ok" />'
+        '<testcase classname="test_solution" name="test_bad">'
+        '<failure message="AssertionError: nope&#10;assert 1 == 2" />'
+        '<error message="failed on teardown" />'
+        "</testcase>"
+        '<testcase classname="test_solution" name="test_skip">'
+        '<skipped message="s" />'
+        "</testcase>"
+        "</testsuite></testsuites>"
+    )
+
+    assert test_runner._parse_junit_report(report) == (
+        1,
+        1,
+        [
+            "FAILED test_solution::test_bad - AssertionError: nope",
+            "ERROR test_solution::test_bad - failed on teardown",
+        ],
+    )